@@ -1,16 +1,35 @@
 # pip install --pre -r requirements.txt
 
-import sys, os, argparse, pathlib, asyncio, logging
+import sys, os, argparse, pathlib, asyncio, logging, json, random, hashlib
 import glob
-from typing import Optional
-from functools import partial
+import fnmatch
+import itertools
+from types import SimpleNamespace
+from typing import List, Literal, Optional
+from functools import lru_cache
 from dotenv import load_dotenv
-from azure.identity import DefaultAzureCredential
-from azure.ai.projects import AIProjectClient
-from azure.ai.agents.models import ListSortOrder
+from azure.identity.aio import DefaultAzureCredential
+from azure.ai.projects.aio import AIProjectClient
+from azure.ai.agents.models import AgentThreadCreationOptions, ListSortOrder, ThreadMessageOptions
 import yaml
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
-load_dotenv()
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# uvloop is optional (not available on Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Only parse .env once per process tree
+if not os.environ.get('_AI_EDIT_ENV_LOADED'):
+    load_dotenv()
+    os.environ['_AI_EDIT_ENV_LOADED'] = '1'
 
 
 # Configure logging
@@ -34,12 +53,116 @@ for noisy_logger in [
 ]:
     logging.getLogger(noisy_logger).setLevel(logging.WARNING)
 
+# Catch-all for other SDK/HTTP loggers (e.g. children created later by SDK internals).
+# Logger filters don't see propagated records, so this goes on the root handlers.
+NOISY_LOGGER_PREFIXES = ('azure.', 'urllib3', 'httpx', 'requests', 'msrest', 'msal')
+
+class NoisyLoggerFilter(logging.Filter):
+    def filter(self, record):
+        return record.levelno >= logging.WARNING or not record.name.startswith(NOISY_LOGGER_PREFIXES)
+
+for handler in logging.getLogger().handlers:
+    handler.addFilter(NoisyLoggerFilter())
+
+
+def match_pattern(pattern: str):
+    """Yield (path, is_file, is_dir) for each entry matching a filename pattern."""
+    parent, name = os.path.split(pattern)
+    if glob.has_magic(parent) or not glob.has_magic(name):
+        # Wildcards in directory components and literal paths go through glob
+        for match in glob.iglob(pattern):
+            yield match, os.path.isfile(match), os.path.isdir(match)
+        return
+    # Single directory: scandir's cached dirent info avoids a stat() per match
+    include_hidden = name.startswith(".")
+    try:
+        with os.scandir(parent or ".") as entries:
+            for entry in entries:
+                if entry.name.startswith(".") and not include_hidden:
+                    continue
+                if fnmatch.fnmatch(entry.name, name):
+                    yield os.path.join(parent, entry.name), entry.is_file(), entry.is_dir()
+    except OSError:
+        return
+
+def iter_files(patterns):
+    """Lazily expand wildcard patterns into deduplicated file paths, skipping directories."""
+    seen = set()
+    for pattern in patterns:
+        matched = False
+        for path, is_file, is_dir in match_pattern(pattern):
+            matched = True
+            if is_file:
+                # Dedup on the resolved path so ./a.md, absolute paths and symlinks count once
+                real_path = os.path.realpath(path)
+                if real_path not in seen:
+                    seen.add(real_path)
+                    yield path
+            elif is_dir:
+                logger.warning(f"Skipping directory: {path}")
+        if not matched:
+            logger.warning(f"No files matched pattern: {pattern}")
 
 def get_all_agents(agent_list, summarizer, implementer):
     """Return a deduplicated list of all agent names, including summarizer and implementer if provided."""
     agents = agent_list + [a for a in (summarizer, implementer) if a]
     return list(dict.fromkeys(filter(None, agents)))
 
+class ModelOptions(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    temperature: float
+    top_p: float
+
+class ModelSection(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    id: str = Field(min_length=1)
+    options: ModelOptions
+
+class ToolOptions(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    server_url: str = Field(min_length=1)
+
+class ToolSection(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    type: Literal["mcp"]
+    id: str = Field(min_length=1)
+    options: ToolOptions
+
+class AgentConfig(BaseModel):
+    """Schema for agent YAML files. Unknown keys are allowed and passed through."""
+    model_config = ConfigDict(extra="allow")
+    model: ModelSection
+    instructions: str = Field(min_length=1)
+    # Tools are optional, but if present must be a valid MCP config
+    tools: Optional[List[ToolSection]] = None
+
+# Bump whenever AgentConfig or the cache payload changes, so older sidecars are re-validated
+AGENT_CACHE_VERSION = 2
+
+def load_cached_config(cache_path: pathlib.Path, yaml_mtime: float) -> Optional[dict]:
+    """Return the cached agent config if the JSON sidecar matches the YAML mtime and cache version, else None."""
+    try:
+        if cache_path.stat().st_mtime < yaml_mtime:
+            return None
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("yaml_mtime") != yaml_mtime:
+        return None
+    if cached.get("version") != AGENT_CACHE_VERSION:
+        return None
+    config = cached.get("config")
+    return config if isinstance(config, dict) else None
+
+def save_cached_config(cache_path: pathlib.Path, yaml_mtime: float, config: dict):
+    """Write a validated agent config to its JSON sidecar. Failures are logged and ignored."""
+    try:
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump({"yaml_mtime": yaml_mtime, "version": AGENT_CACHE_VERSION, "config": config}, f)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Could not write agent cache '{cache_path}': {e}")
+
 def check_agent_files(all_agents):
     """Check for existence and validity of agent YAML files. Returns a dict of agent configs."""
     base_dir = pathlib.Path(__file__).resolve().parent
@@ -49,38 +172,29 @@ def check_agent_files(all_agents):
         # Only allow YAML in agents
         yaml_path = base_dir / "agents" / f"{a}.yml"
         if yaml_path.exists():
+            # Reuse the validated config from a previous run if the YAML is unchanged
+            cache_path = yaml_path.with_suffix(".yml.cache.json")
+            yaml_mtime = yaml_path.stat().st_mtime
+            config = load_cached_config(cache_path, yaml_mtime)
+            if config is not None:
+                agent_configs[a] = config
+                continue
             try:
                 with open(yaml_path, "r", encoding="utf-8") as f:
                     try:
-                        config = yaml.safe_load(f)
+                        config = yaml.load(f, Loader=_YamlLoader)
                     except yaml.YAMLError as ye:
                         logger.error(f"YAML parsing error in '{yaml_path}': {ye}")
                         sys.exit(1)
                 # Validate required fields
-                errors = []
-                if not ("model" in config and isinstance(config["model"], dict)):
-                    errors.append("missing 'model' section")
-                else:
-                    if not config["model"].get("id"):
-                        errors.append("missing 'model.id'")
-                    if not ("options" in config["model"] and isinstance(config["model"]["options"], dict)):
-                        errors.append("missing 'model.options'")
-                    else:
-                        if config["model"]["options"].get("temperature") is None:
-                            errors.append("missing 'model.options.temperature'")
-                        if config["model"]["options"].get("top_p") is None:
-                            errors.append("missing 'model.options.top_p'")
-                if not config.get("instructions"):
-                    errors.append("missing 'instructions'")
-                # Tool validation (optional, but if present must be valid)
-                if "tools" in config and config["tools"]:
-                    tool = config["tools"][0]
-                    if not (tool.get("type") == "mcp" and tool.get("id") and tool.get("options") and tool["options"].get("server_url")):
-                        errors.append("invalid or incomplete MCP tool config in 'tools'")
-                if errors:
+                try:
+                    AgentConfig.model_validate(config)
+                except ValidationError as ve:
+                    errors = [f"'{'.'.join(str(p) for p in err['loc']) or 'config'}': {err['msg']}" for err in ve.errors()]
                     logger.error(f"Agent '{a}' YAML errors: {', '.join(errors)}")
                     sys.exit(1)
                 agent_configs[a] = config
+                save_cached_config(cache_path, yaml_mtime, config)
             except Exception as e:
                 logger.error(f"Unexpected error loading agent YAML '{yaml_path}': {e}")
                 sys.exit(1)
@@ -91,8 +205,24 @@ def check_agent_files(all_agents):
         sys.exit(1)
     return agent_configs
 
-def get_azure_clients():
-    """Create and return Azure agents client using environment variables."""
+async def gather_or_cancel(*aws):
+    """Like asyncio.gather, but if one awaitable fails the rest are cancelled and awaited before re-raising."""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+def content_digest(content: str) -> bytes:
+    """Return a digest of text content, used to detect unchanged implementer output."""
+    return hashlib.blake2b(content.encode("utf-8")).digest()
+
+@lru_cache(maxsize=1)
+def get_azure_config():
+    """Read and validate Azure settings from environment variables once per process."""
     endpoint = os.environ.get('AZURE_PROJECT_ENDPOINT')
     if not endpoint:
         logger.critical("AZURE_PROJECT_ENDPOINT environment variable is not set.")
@@ -101,23 +231,48 @@ def get_azure_clients():
     if not (endpoint.startswith("https://") and ".azure" in endpoint):
         logger.critical(f"AZURE_PROJECT_ENDPOINT appears invalid: {endpoint}")
         sys.exit(1)
-    credential = DefaultAzureCredential()
-    project_client = AIProjectClient(endpoint, credential)
-    agents_client = project_client.agents
-    return agents_client
+    return SimpleNamespace(endpoint=endpoint)
+
+@lru_cache(maxsize=1)
+def get_credential():
+    """Return the process-wide Azure credential."""
+    return DefaultAzureCredential()
+
+def get_azure_clients():
+    """Create and return the async Azure credential and project client using environment variables."""
+    config = get_azure_config()
+    credential = get_credential()
+    project_client = AIProjectClient(config.endpoint, credential)
+    return credential, project_client
+
+
+# Prompt builders per agent role: (instructions, agent feedback, file content) -> user prompt
+PROMPT_BUILDERS = {
+    "summarizer": lambda instructions, feedback, content: f"{instructions}\n\nAGENT FEEDBACK START\n\n{feedback}\nAGENT FEEDBACK END",
+    "implementer": lambda instructions, feedback, content: f"{instructions}\n\nEdit the content (between CONTENT_START and CONTENT_END) based on the agent feedback.\n\nAGENT FEEDBACK START\n\n{feedback}\nAGENT FEEDBACK END\n\nCONTENT START\n{content}\nCONTENT END",
+    "reviewer": lambda instructions, feedback, content: f"{instructions}\n\nReview the following content and provide feedback.\n\nCONTENT START\n{content}\nCONTENT END",
+}
 
 
 class AgentManager:
     """Manages agent lifecycle and deployment."""
-    def __init__(self, agent_configs: dict, agents_client, verbose: bool = False):
+    def __init__(self, agent_configs: dict, agents_client, summarizer: Optional[str] = None, implementer: Optional[str] = None, verbose: bool = False):
         self.agent_configs = agent_configs
         self.agents_client = agents_client
         self.verbose = verbose
-        self.agent_feedback = []
+        self.instructions_by_agent = {a: cfg.get("instructions", "") for a, cfg in agent_configs.items()}
+        self._role = {
+            a: "summarizer" if a == summarizer else "implementer" if a == implementer else "reviewer"
+            for a in agent_configs
+        }
+        self._prompt_builders = {a: PROMPT_BUILDERS[role] for a, role in self._role.items()}
+        # Feedback is tracked per file so files can be processed concurrently
+        self.agent_feedback = {}
+        # Digest of each file's current content, so unchanged output is not written back
+        self.content_hashes = {}
         self.agent_objs = {}
 
     async def create_agent(self, agent_name: str):
-        loop = asyncio.get_running_loop()
         config = self.agent_configs[agent_name]
         # All required fields are validated in check_agent_files
         model_deployment_name = config["model"]["id"]
@@ -134,17 +289,13 @@ class AgentManager:
                 "allowed_tools": [tool["id"]],
             }
             tools.append(mcp_tool_dict)
-        agent = await loop.run_in_executor(
-            None,
-            partial(
-                self.agents_client.create_agent,
-                model=model_deployment_name,
-                name=f"agent-{agent_name}",
-                instructions=instructions,
-                tools=tools if tools else None,
-                temperature=temperature,
-                top_p=top_p
-            )
+        agent = await self.agents_client.create_agent(
+            model=model_deployment_name,
+            name=f"agent-{agent_name}",
+            instructions=instructions,
+            tools=tools if tools else None,
+            temperature=temperature,
+            top_p=top_p
         )
         mcp_server = None
         if tools and tools[0].get("type") == "mcp":
@@ -152,81 +303,74 @@ class AgentManager:
         logger.info(f"Created agent: {agent.id} ({agent_name}, model={model_deployment_name}, MCP={mcp_server})")
         self.agent_objs[agent_name] = {"agent": agent, "agents_client": self.agents_client}
 
+    async def _delete_one(self, agent_name: str, agent_obj: dict):
+        agent = agent_obj["agent"]
+        try:
+            await self.agents_client.delete_agent(agent.id)
+            logger.info(f"Deleted agent: {agent.id} ({agent_name})")
+        except Exception as e:
+            logger.warning(f"Could not delete agent {agent.id} ({agent_name}): {e}")
+
     async def delete_all_agents(self):
-        loop = asyncio.get_running_loop()
-        for agent_name, agent_obj in self.agent_objs.items():
-            agent = agent_obj["agent"]
-            try:
-                await loop.run_in_executor(None, self.agents_client.delete_agent, agent.id)
-                logger.info(f"Deleted agent: {agent.id} ({agent_name})")
-            except Exception as e:
-                logger.warning(f"Could not delete agent {agent.id} ({agent_name}): {e}")
+        await asyncio.gather(
+            *(self._delete_one(agent_name, agent_obj) for agent_name, agent_obj in self.agent_objs.items()),
+            return_exceptions=True
+        )
 
-    async def deploy_agent(self, agent_name: str, filename: str, agent_system_prompt: str, summarizer: Optional[str] = None, implementer: Optional[str] = None):
-        loop = asyncio.get_running_loop()
+    async def deploy_agent(self, agent_name: str, filename: str, file_content: str = ""):
         agent_obj = self.agent_objs[agent_name]
         agents_client = agent_obj['agents_client']
         agent_id = agent_obj['agent'].id
-        thread = await loop.run_in_executor(None, agents_client.threads.create)
-        user_prompt = ""
-        file_content = ""
-        config = self.agent_configs[agent_name]
-        instructions = config.get("instructions", agent_system_prompt)
+        agent_feedback = self.agent_feedback.setdefault(filename, [])
+        role = self._role[agent_name]
+        prompt_messages = None
+        instructions = self.instructions_by_agent[agent_name]
         if filename:
-            with open(filename, "r", encoding="utf-8") as f:
-                file_content = f.read()
-            if agent_name == summarizer:
-                user_prompt = f"{instructions}\n\nAGENT FEEDBACK START\n\n{self.agent_feedback}\nAGENT FEEDBACK END"
-            elif agent_name == implementer:
-                user_prompt = f"{instructions}\n\nEdit the content (between CONTENT_START and CONTENT_END) based on the agent feedback.\n\nAGENT FEEDBACK START\n\n{self.agent_feedback}\nAGENT FEEDBACK END\n\nCONTENT START\n{file_content}\nCONTENT END"
-            else:
-                user_prompt = f"{instructions}\n\nReview the following content and provide feedback.\n\nCONTENT START\n{file_content}\nCONTENT END"
-            await loop.run_in_executor(
-                None,
-                partial(
-                    agents_client.messages.create,
-                    thread_id=thread.id,
-                    content=user_prompt,
-                    role="user"
-                )
-            )
-
-        run = await loop.run_in_executor(
-            None,
-            partial(agents_client.runs.create, thread_id=thread.id, agent_id=agent_id)
-        )
+            user_prompt = self._prompt_builders[agent_name](instructions, agent_feedback, file_content)
+            prompt_messages = [ThreadMessageOptions(role="user", content=user_prompt)]
+
+        # Create the thread, post the prompt and start the run in a single round-trip
+        thread_options = AgentThreadCreationOptions(messages=prompt_messages) if prompt_messages else None
+        run = await agents_client.create_thread_and_run(agent_id=agent_id, thread=thread_options)
+        thread_id = run.thread_id
         logger.info(f"Created run ({agent_name}), ID: {run.id}")
+        # Poll with jittered exponential backoff (100ms up to 2s)
+        delay = 0.1
         while run.status in ["queued", "in_progress", "requires_action"]:
-            await asyncio.sleep(1)
-            run = await loop.run_in_executor(None, agents_client.runs.get, thread.id, run.id)
+            await asyncio.sleep(random.uniform(0.8, 1.2) * delay)
+            delay = min(delay * 1.5, 2.0)
+            run = await agents_client.runs.get(thread_id=thread_id, run_id=run.id)
         if run.status == "failed":
             logger.info(f"Run failed: {run.last_error}")
             return ""
 
         file_output = ""
-        messages = await loop.run_in_executor(
-            None,
-            partial(agents_client.messages.list, thread_id=thread.id, order=ListSortOrder.ASCENDING)
-        )
-        for msg in messages:
+        # Only the run's latest assistant message is used, so fetch newest-first and stop at it
+        messages = agents_client.messages.list(thread_id=thread_id, run_id=run.id, limit=1, order=ListSortOrder.DESCENDING)
+        async for msg in messages:
             if getattr(msg, 'role', None) == "assistant" and msg.text_messages:
                 feedback = msg.text_messages[-1].text.value
-                if summarizer and agent_name == summarizer:
-                    self.agent_feedback.clear()
-                    self.agent_feedback.append(feedback)
+                if role == "summarizer":
+                    agent_feedback.clear()
+                    agent_feedback.append(feedback)
                     if self.verbose:
                         logger.info(f"\n[{agent_name}]:\n{feedback}\n{'-'*100}")
-                elif agent_name == implementer:
+                elif role == "implementer":
                     file_output = feedback
                 else:
-                    self.agent_feedback.append(feedback)
+                    agent_feedback.append(feedback)
                     if self.verbose:
                         logger.info(f"\n[{agent_name}]:\n{feedback}\n{'-'*100}")
+                break
         try:
-            if agent_name == implementer:
-                logger.info(f"Saving changes to file: {filename}\n")
-                with open(filename, "w", encoding="utf-8") as f:
-                    f.write(file_output)
+            if role == "implementer":
+                output_hash = content_digest(file_output)
+                if output_hash == self.content_hashes.get(filename):
+                    logger.info(f"No changes to save for file: {filename}\n")
+                else:
+                    logger.info(f"Saving changes to file: {filename}\n")
+                    with open(filename, "w", encoding="utf-8") as f:
+                        f.write(file_output)
         except Exception as e:
             logger.warning(f"Error in agent '{agent_name}': {e}")
         return ""
@@ -250,6 +394,16 @@ def main():
     implementer: Optional[str] = args.implementer.strip() if args.implementer else None
     verbose = args.verbose.strip().upper() == "Y"
 
+    # Validate file concurrency before any agents are created
+    max_workers_env = os.environ.get('MAX_FILE_CONCURRENCY', '8')
+    try:
+        max_workers = int(max_workers_env)
+    except ValueError:
+        max_workers = 0
+    if max_workers < 1:
+        logger.error(f"MAX_FILE_CONCURRENCY must be a positive integer, got: {max_workers_env}")
+        sys.exit(1)
+
     logger.info(f"Worker Agents: {agent_list}")
     logger.info(f"Summarizer Agent: {summarizer}")
     logger.info(f"Implementer Agent: {implementer}")
@@ -257,59 +411,76 @@ def main():
     logger.info(f"Filenames: {args.filenames}")
 
     # Expand wildcards and flatten the list of files
-    expanded_files = []
-    for pattern in args.filenames:
-        matches = glob.glob(pattern)
-        if matches:
-            # Filter out directories from the matches
-            for match in matches:
-                if os.path.isfile(match):
-                    expanded_files.append(match)
-                elif os.path.isdir(match):
-                    logger.warning(f"Skipping directory: {match}")
-        else:
-            logger.warning(f"No files matched pattern: {pattern}")
-    if not expanded_files:
+    expanded_files = iter_files(args.filenames)
+    first_file = next(expanded_files, None)
+    if first_file is None:
         logger.error("No files found to process.")
         sys.exit(1)
+    expanded_files = itertools.chain([first_file], expanded_files)
 
     all_agents = get_all_agents(agent_list, summarizer, implementer)
     agent_configs = check_agent_files(all_agents)
-    agents_client = get_azure_clients()
-    agent_manager = AgentManager(agent_configs, agents_client, verbose=verbose)
+    credential, project_client = get_azure_clients()
+    agent_manager = AgentManager(agent_configs, project_client.agents, summarizer, implementer, verbose=verbose)
+
+    async def run_agents():
+        # Close the async credential and client transports when done
+        async with credential, project_client:
+            try:
+                # Create all agent objects first, concurrently. Failures are collected so the
+                # agents that were created are still deleted below.
+                results = await asyncio.gather(*(agent_manager.create_agent(agent_name) for agent_name in all_agents), return_exceptions=True)
+                for result in results:
+                    if isinstance(result, BaseException):
+                        raise result
 
+                async def process_file(filename: str):
+                    logger.info(f"Processing file: {filename}")
+                    # Read the file once and share the content across all agents
+                    file_content = pathlib.Path(filename).read_text(encoding="utf-8")
+                    if implementer:
+                        agent_manager.content_hashes[filename] = content_digest(file_content)
+                    # Run all agents concurrently except summarizer and implementer
+                    await gather_or_cancel(*[
+                        agent_manager.deploy_agent(agent, filename, file_content=file_content)
+                        for agent in agent_list
+                    ])
 
-    def get_instructions(agent: str) -> str:
-        """Get instructions for a given agent from its config."""
-        config = agent_configs[agent]
-        return config.get("instructions", "")
+                    # Run summarizer (summarizes findings of previous agents)
+                    if summarizer:
+                        await agent_manager.deploy_agent(summarizer, filename, file_content=file_content)
 
-    async def run_agents():
-        # Create all agent objects first
-        for agent_name in all_agents:
-            await agent_manager.create_agent(agent_name)
+                    # Run implementer (updates the file with agent findings)
+                    if implementer:
+                        await agent_manager.deploy_agent(implementer, filename, file_content=file_content)
+
+                    agent_manager.agent_feedback.pop(filename, None)
+                    agent_manager.content_hashes.pop(filename, None)
 
-        for filename in expanded_files:
-            logger.info(f"Processing file: {filename}")
-            # Run all agents concurrently except summarizer and implementer
-            await asyncio.gather(*[
-                agent_manager.deploy_agent(agent, filename, get_instructions(agent), summarizer, implementer)
-                for agent in agent_list
-            ])
+                # Stream files through a bounded queue to MAX_FILE_CONCURRENCY workers
+                file_queue = asyncio.Queue(maxsize=32)
 
-            # Run summarizer (summarizes findings of previous agents)
-            if summarizer:
-                await agent_manager.deploy_agent(summarizer, filename, get_instructions(summarizer), summarizer, implementer)
+                async def produce_files():
+                    for filename in expanded_files:
+                        await file_queue.put(filename)
+                    for _ in range(max_workers):
+                        await file_queue.put(None)
 
-            # Run implementer (updates the file with agent findings)
-            if implementer:
-                await agent_manager.deploy_agent(implementer, filename, get_instructions(implementer), summarizer, implementer)
+                async def consume_files():
+                    while True:
+                        filename = await file_queue.get()
+                        if filename is None:
+                            return
+                        await process_file(filename)
 
-        # Delete all agents at the end
-        await agent_manager.delete_all_agents()
+                await gather_or_cancel(produce_files(), *(consume_files() for _ in range(max_workers)))
+            finally:
+                # Delete all agents at the end, even if something above failed
+                await agent_manager.delete_all_agents()
 
     try:
-        asyncio.run(run_agents())
+        # Prefer uvloop's faster event loop when it is installed
+        (uvloop.run if uvloop else asyncio.run)(run_agents())
     except Exception as e:
         logger.critical(f"Fatal error: {e}", exc_info=True)
 